@@ -31,11 +31,16 @@ from typing import Any
 
 import yaml
 
+# libyaml (C 実装) が使えればそちらでパースする。純 Python の SafeLoader より
+# 数倍速い。PyYAML が libyaml 無しでビルドされている環境では SafeLoader に
+# フォールバックする (どちらも safe_load と同じく任意オブジェクトを構築しない)。
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def _parse_yaml(yaml_text: str, source: str) -> dict[str, Any]:
     """YAML 文字列をパースして dict を返す。検証付き。"""
     try:
-        data = yaml.safe_load(yaml_text)
+        data = yaml.load(yaml_text, Loader=_YAML_LOADER)
     except yaml.YAMLError as e:
         raise ValueError(f"{source} の YAML パースに失敗: {e}") from e
 
@@ -199,6 +204,106 @@ def _expand_server_templates(config: dict[str, Any]) -> dict[str, Any]:
     return expanded
 
 
+# sql_servers の各エントリに必須のキーと、対応している engine
+_REQUIRED_SERVER_KEYS = (
+    'name',
+    'engine',
+    'host',
+    'port',
+    'schema',
+    'user',
+    'password',
+)
+_SUPPORTED_ENGINES = ('postgres', 'mysql')
+_REQUIRED_SSH_TUNNEL_KEYS = ('host', 'user')
+# 省略可能で、指定する場合は 1 以上の整数であるべきサーバー項目
+_POSITIVE_INT_SERVER_KEYS = ('max_rows', 'pool_size')
+
+
+def _validate_servers(config: dict[str, Any]) -> None:
+    """
+    テンプレート展開後の sql_servers をロード時に検証する。
+
+    キー欠落や engine の打ち間違いを、最初のクエリ実行時の KeyError /
+    Unsupported engine ではなく、config ロードの時点で分かるエラーにする。
+    _expand_server_templates と同じく、エラーメッセージには要素の repr を
+    載せず位置 (index) と name・キー名のみを示す。
+    """
+    servers = config.get('sql_servers', [])
+    if not isinstance(servers, list):
+        raise ValueError("sql_servers はリストである必要があります")
+
+    for i, server in enumerate(servers):
+        if not isinstance(server, dict):
+            raise ValueError(
+                f"sql_servers の {i} 番目の要素は"
+                "マッピングである必要があります"
+            )
+        missing = [key for key in _REQUIRED_SERVER_KEYS if key not in server]
+        if missing:
+            raise ValueError(
+                f"sql_servers の {i} 番目の要素"
+                f" (name={server.get('name')!r}) に必須キーがありません:"
+                f" {missing}"
+            )
+        if server['engine'] not in _SUPPORTED_ENGINES:
+            raise ValueError(
+                f"sql_servers の {i} 番目の要素 (name={server['name']!r}) の"
+                f" engine は {list(_SUPPORTED_ENGINES)} のいずれかである"
+                "必要があります"
+            )
+        for key in _POSITIVE_INT_SERVER_KEYS:
+            value = server.get(key)
+            if value is not None and (
+                not isinstance(value, int)
+                or isinstance(value, bool)
+                or value < 1
+            ):
+                raise ValueError(
+                    f"sql_servers の {i} 番目の要素 (name={server['name']!r})"
+                    f" の {key} は 1 以上の整数である必要があります"
+                )
+        ttl = server.get('result_cache_ttl_seconds')
+        if ttl is not None and (
+            not isinstance(ttl, (int, float))
+            or isinstance(ttl, bool)
+            or ttl < 0
+        ):
+            raise ValueError(
+                f"sql_servers の {i} 番目の要素 (name={server['name']!r})"
+                " の result_cache_ttl_seconds は 0 以上の数である必要があります"
+            )
+        pool_timeout = server.get('pool_timeout_seconds')
+        if pool_timeout is not None and (
+            not isinstance(pool_timeout, (int, float))
+            or isinstance(pool_timeout, bool)
+            or pool_timeout <= 0
+        ):
+            raise ValueError(
+                f"sql_servers の {i} 番目の要素 (name={server['name']!r})"
+                " の pool_timeout_seconds は 0 より大きい数である必要があります"
+            )
+        ssh_tunnel = server.get('ssh_tunnel')
+        if ssh_tunnel is not None:
+            if not isinstance(ssh_tunnel, dict):
+                raise ValueError(
+                    f"sql_servers の {i} 番目の要素"
+                    f" (name={server['name']!r}) の ssh_tunnel は"
+                    "マッピングである必要があります"
+                )
+            missing = [
+                key
+                for key in _REQUIRED_SSH_TUNNEL_KEYS
+                if key not in ssh_tunnel
+            ]
+            if missing:
+                raise ValueError(
+                    f"sql_servers の {i} 番目の要素"
+                    f" (name={server['name']!r}) の ssh_tunnel に"
+                    f"必須キーがありません: {missing}"
+                )
+
+
 def load_config(config_filename: str = 'config.yaml') -> dict[str, Any]:
     """
     設定を読み込んで dict で返す。
@@ -230,7 +335,9 @@ def load_config(config_filename: str = 'config.yaml') -> dict[str, Any]:
             with open(config_path, 'r', encoding='utf-8') as f:
                 data = _parse_yaml(f.read(), config_path)
 
-    return _expand_server_templates(data)
+    config = _expand_server_templates(data)
+    _validate_servers(config)
+    return config
 
 
 # -- 機密を含まないサーバーメタデータのローカルキャッシュ --
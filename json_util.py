@@ -0,0 +1,68 @@
+"""
+ツールのレスポンスや CLI の出力を JSON 文字列にするヘルパー。
+
+MCP サーバーと CLI で同じエンコーダを使うため、ここにまとめる。
+標準の json より高速な orjson を使う。orjson は UTF-8 をそのまま出力するので、
+json.dumps(ensure_ascii=False) と同じく日本語はエスケープされない。
+"""
+
+import decimal
+from typing import Any, Callable
+
+import orjson
+
+
+def _decimal_to_float(obj: decimal.Decimal) -> float:
+    return float(obj)
+
+
+def _bytes_to_str(obj: bytes | bytearray | memoryview) -> str:
+    # bytea / BLOB。UTF-8 として読めればテキスト、読めなければ hex にする。
+    data = bytes(obj)
+    # ID / ハッシュ等の ASCII だけの値は try/except を組まずに済ませる。
+    if data.isascii():
+        return data.decode('ascii')
+    try:
+        return data.decode('utf-8')
+    except UnicodeDecodeError:
+        return data.hex()
+
+
+# 型 -> 変換関数。_default は type(obj) で 1 回引くだけで済ませ、isinstance の
+# 連鎖を毎セル辿らない。
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    decimal.Decimal: _decimal_to_float,
+    bytes: _bytes_to_str,
+    bytearray: _bytes_to_str,
+    memoryview: _bytes_to_str,
+}
+
+
+def _default(obj: Any) -> Any:
+    """orjson が直接扱えない型を変換する (未知の型に出会った時だけ呼ばれる)。
+
+    datetime / date / time / UUID は orjson がそのまま ISO 形式等で出力する。
+    """
+    converter = _CONVERTERS.get(type(obj))
+    if converter is not None:
+        return converter(obj)
+    # サブクラス (まず無いが) は isinstance で拾う。
+    for cls, converter in _CONVERTERS.items():
+        if isinstance(obj, cls):
+            return converter(obj)
+    # timedelta (interval / MySQL TIME) 等は str() にする。
+    return str(obj)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """obj を JSON 文字列にする。
+
+    Args:
+        obj: JSON にする値
+        indent: True なら 2 スペースでインデントする
+
+    DB ドライバが返した行 (Decimal / bytes 等を含む) をそのまま渡してよい。
+    変換は _default で行う。
+    """
+    option = orjson.OPT_INDENT_2 if indent else 0
+    return orjson.dumps(obj, default=_default, option=option).decode('utf-8')
@@ -1,10 +1,119 @@
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import time
 
 _current_log_file_path: str | None = None
 
+# 全ロガーで共有する単一のキューと QueueHandler。ロガーへの付け替えは初回の
+# setup でだけ行い、以降のログパス切り替えは listener の差し替えだけで済ませる。
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_QUEUE_HANDLER = logging.handlers.QueueHandler(_LOG_QUEUE)
+_loggers_configured = False
+
+# ファイル書き込みを担うバックグラウンドスレッド (ログパス毎に差し替える)。
+_listener: logging.handlers.QueueListener | None = None
+
 DEFAULT_LOG_FILE_PATH = '/tmp/sql-agent/sql-agent-mcp-server.log'
 
+# サードパーティロガーのレベル。ハンドラは共有の _QUEUE_HANDLER を付ける。
+_THIRD_PARTY_LOG_LEVELS = (
+    ('httpx', logging.WARNING),
+    ('urllib3', logging.WARNING),
+    ('asyncio', logging.WARNING),
+    ('fastmcp', logging.INFO),
+    ('FastMCP.fastmcp.server.server', logging.INFO),
+    ('mcp', logging.WARNING),
+    ('uvicorn', logging.WARNING),
+    ('rich', logging.WARNING),
+)
+
+# ログファイルの userspace バッファサイズ。
+_LOG_BUFFER_SIZE = 64 * 1024
+
+# ログファイルのローテーション設定。長時間動くサーバーでファイルが際限なく
+# 肥大化しないよう、16 MiB を超えたら切り替え、古いものは 4 世代まで残す。
+_LOG_MAX_BYTES = 16 * 1024 * 1024
+_LOG_BACKUP_COUNT = 4
+
+
+class _BufferedFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    レコード毎に flush しない RotatingFileHandler。
+
+    書き込みは大きめのバッファに溜めて write() システムコールをまとめ、
+    flush は _IdleFlushQueueListener がキューが空になった時 (= 連続した
+    ログが一段落した時) に flush_buffer() で行う。close 時には
+    ストリームの close がバッファを書き出す。
+    """
+
+    def _open(self):
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        # 既定実装の stream.tell() はテキストストリームのバッファを flush して
+        # しまうので、flush を伴わない下層のバイナリバッファの位置で判定する。
+        # TextIOWrapper 内の未転送分 (数 KB) だけ遅れるが閾値判定には十分。
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or self.stream.buffer.tell() < self.maxBytes:
+            return False
+        # /dev/null 等の通常ファイル以外はローテーションしない (既定実装と同じ)。
+        return os.path.isfile(self.baseFilename)
+
+    def flush(self) -> None:
+        # StreamHandler.emit がレコード毎に呼ぶ flush は何もしない。
+        pass
+
+    def flush_buffer(self) -> None:
+        super().flush()
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    asctime の秒までの部分をキャッシュする Formatter。
+
+    既定の formatTime はレコード毎に localtime + strftime を呼ぶが、同じ秒の
+    レコードなら結果は同じなので、秒が変わった時だけ作り直す。ミリ秒部分は
+    既定と同じ書式 (default_msec_format) で毎回付け足すので出力は変わらない。
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cached_second: int | None = None
+        self._cached_time = ''
+
+    def formatTime(
+        self, record: logging.LogRecord, datefmt: str | None = None
+    ) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_time = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+            self._cached_second = second
+        return self.default_msec_format % (self._cached_time, record.msecs)
+
+
+class _IdleFlushQueueListener(logging.handlers.QueueListener):
+    """キューが空になったタイミングでハンドラのバッファを書き出す。"""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush_buffer()
+
 
 def setup_logger_for_mcp_server(log_file_path: str | None = None) -> None:
     """
@@ -17,11 +126,16 @@ def setup_logger_for_mcp_server(log_file_path: str | None = None) -> None:
         3. DEFAULT_LOG_FILE_PATH
 
     同じパスで2回呼ばれた場合は何もしない (冪等)。
-    異なるパスで呼ばれた場合は、ハンドラを差し替える
+    異なるパスで呼ばれた場合は、ファイルハンドラを差し替える
     (起動シーケンスで先にデフォルトパスで初期化 → config 読み込み後に
     log_file_path で再設定するユースケースに対応)。
+
+    ロガーには共有の QueueHandler を付け、実際のファイル書き込みは
+    QueueListener のバックグラウンドスレッドで行う。ツール呼び出し側
+    (イベントループ) はレコードをキューに積むだけになり、write() の
+    ブロッキングがリクエスト経路から外れる。
     """
-    global _current_log_file_path
+    global _current_log_file_path, _listener, _loggers_configured
 
     if log_file_path is None:
         log_file_path = os.environ.get(
@@ -38,16 +152,35 @@ def setup_logger_for_mcp_server(log_file_path: str | None = None) -> None:
 
     # FileHandler の作成が失敗 (権限不正・ディレクトリ未存在等) しても
     # 状態を破壊しないよう、_current_log_file_path の更新は成功した後で行う。
-    file_handler = logging.FileHandler(
-        log_file_path, mode='a', encoding='utf-8'
+    # delay=True: 実際にログが出るまでファイルを開かない。
+    file_handler = _BufferedFileHandler(
+        log_file_path,
+        mode='a',
+        maxBytes=_LOG_MAX_BYTES,
+        backupCount=_LOG_BACKUP_COUNT,
+        encoding='utf-8',
+        delay=True,
     )
     file_handler.setFormatter(
-        logging.Formatter(
+        _CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
     )
     _current_log_file_path = log_file_path
 
+    # 旧 listener を先に止めてから新しい listener を起動する (同じキューを
+    # 2 スレッドで取り合わないように)。stop() は旧ファイルへ積まれた分を
+    # 書き出してから戻り、その間に積まれたレコードは新しい listener が拾う。
+    if _listener is not None:
+        _stop_listener(_listener)
+    _listener = _IdleFlushQueueListener(
+        _LOG_QUEUE, file_handler, respect_handler_level=True
+    )
+    _listener.start()
+
+    if _loggers_configured:
+        return
+
     def _replace_handlers(target_logger: logging.Logger) -> None:
         # ファイルディスクリプタを残さないために古いハンドラを close してから外す
         # (特に Windows でファイルロック競合を避けるため)。
@@ -57,7 +190,7 @@ def setup_logger_for_mcp_server(log_file_path: str | None = None) -> None:
             except Exception:
                 pass
         target_logger.handlers.clear()
-        target_logger.addHandler(file_handler)
+        target_logger.addHandler(_QUEUE_HANDLER)
 
     # Configure root logger - これが一番重要！
     root_logger = logging.getLogger()
@@ -65,21 +198,34 @@ def setup_logger_for_mcp_server(log_file_path: str | None = None) -> None:
     root_logger.setLevel(logging.DEBUG)
 
     # Configure third-party loggers
-    for logger_name, log_level in [
-        ('httpx', logging.WARNING),
-        ('urllib3', logging.WARNING),
-        ('asyncio', logging.WARNING),
-        ('fastmcp', logging.INFO),
-        ('FastMCP.fastmcp.server.server', logging.INFO),
-        ('mcp', logging.WARNING),
-        ('uvicorn', logging.WARNING),
-        ('rich', logging.WARNING),
-    ]:
+    for logger_name, log_level in _THIRD_PARTY_LOG_LEVELS:
         _logger = logging.getLogger(logger_name)
         _replace_handlers(_logger)
         _logger.setLevel(log_level)
         _logger.propagate = False
 
+    _loggers_configured = True
+
+
+def _stop_listener(listener: _IdleFlushQueueListener) -> None:
+    """listener を止め、それが持つファイルハンドラを閉じる。"""
+    listener.stop()
+    for handler in listener.handlers:
+        try:
+            handler.close()
+        except Exception:
+            pass
+
+
+@atexit.register
+def _shutdown_listener() -> None:
+    # 終了時にキューに残ったレコードを書き出す。logging モジュール自身の
+    # atexit (logging.shutdown) より後に登録されるので、そちらより先に走る。
+    global _listener
+    if _listener is not None:
+        _stop_listener(_listener)
+        _listener = None
+
 
 # メインロガー (setup 前でも import 可能。setup 後に handler が付く)
 logger = logging.getLogger('sql_agent')
@@ -3,18 +3,145 @@
 MCP server for connecting to MySQL and PostgreSQL databases
 """
 
-import json
+import asyncio
+import functools
+import inspect
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from textwrap import dedent
-from typing import Annotated
+from typing import Annotated, Any, Awaitable, Callable
 
 import fastmcp
 from pydantic import Field
 
 from config_loader import load_config, load_metadata_cache
+from json_util import dumps
 from logging_config import logger, setup_logger_for_mcp_server
-from sql_agent import SQLAgentManager
+from sql_agent import ResultFormat, SQLAgentManager
+
+# MCP クライアント (LLM) にとってインデントは意味の無いバイトなので、既定では
+# コンパクトに出力する。人が目視でデバッグする時は SQL_AGENT_PRETTY_JSON=1 で
+# インデント付きにできる。
+_JSON_INDENT = os.environ.get('SQL_AGENT_PRETTY_JSON') == '1'
+
+
+def _dumps(obj: Any) -> str:
+    """ツールのレスポンスを JSON 文字列にする。"""
+    return dumps(obj, indent=_JSON_INDENT)
+
+
+# DB 問い合わせ (ドライバ・SSH トンネル・getter command) はブロッキングなので
+# 専用のスレッドプールで実行する。既定の executor (asyncio.to_thread) は
+# CPU 数で上限が決まり FastMCP 側の処理とも共有されるため、I/O 待ちが主体の
+# クエリ用には並列数を明示した専用プールを持つ。
+_DB_EXECUTOR = ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix='sql-agent-db'
+)
+# config のロード (getter command) とサーバー名の確認用。遅いサーバーへの
+# クエリで _DB_EXECUTOR が埋まっても、list_sql_servers やサーバー名の確認が
+# その後ろに並ばないよう別のプールで実行する。
+_CONFIG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix='sql-agent-config'
+)
+
+
+async def _run_blocking(
+    func: Callable[..., Any],
+    *args: Any,
+    executor: ThreadPoolExecutor = _DB_EXECUTOR,
+) -> Any:
+    """ブロッキング関数を executor (既定は _DB_EXECUTOR) で実行し、結果を待つ"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, func, *args)
+
+
+# 引数不足のエラーレスポンスは内容が固定なので、import 時に一度だけ JSON 化して
+# おき、ツールからはそのまま返す。
+_ERROR_NO_SERVER_NAME = _dumps(
+    {'success': False, 'error': 'server_name is not specified'}
+)
+_ERROR_NO_SQL = _dumps(
+    {'success': False, 'error': 'SQL query is not specified'}
+)
+_ERROR_NO_SQLS = _dumps(
+    {'success': False, 'error': 'SQL queries are not specified'}
+)
+
+
+def _json_tool(
+    required: dict[str, str] | None = None,
+    error_fields: dict[str, str] | None = None,
+) -> Callable[
+    [Callable[..., Awaitable[dict[str, Any] | str]]],
+    Callable[..., Awaitable[str]],
+]:
+    """ツール本体を JSON 文字列を返す MCP ツールにするデコレーター。
+
+    引数チェック・例外処理・JSON 化は全ツール共通なのでここにまとめ、ツール本体は
+    結果の dict (または JSON 化済みの str) を返すだけにする。
+
+    Args:
+        required: 必須引数名 -> 未指定時に返す JSON 化済みのエラーレスポンス
+        error_fields: 例外時のレスポンスに含めるキー -> 引数名
+    """
+    required = required or {}
+    error_fields = error_fields or {}
+
+    def decorator(
+        func: Callable[..., Awaitable[dict[str, Any] | str]],
+    ) -> Callable[..., Awaitable[str]]:
+        @functools.wraps(func)
+        async def wrapper(**kwargs: Any) -> str:
+            for name, error_response in required.items():
+                if not kwargs.get(name):
+                    return error_response
+
+            # JSON 化も try の中で行う。orjson が扱えない値 (64 bit を
+            # 超える整数・深すぎるネスト等) でも例外を MCP に漏らさず、
+            # 他の失敗と同じエラーレスポンスを返す。
+            try:
+                result = await func(**kwargs)
+                if isinstance(result, str):
+                    return result
+                return _dumps(result)
+            except Exception as e:
+                logger.error("ツール実行エラー (%s): %s", func.__name__, e)
+                response = {'success': False, 'error': str(e)}
+                for key, name in error_fields.items():
+                    response[key] = kwargs.get(name)
+                return _dumps(response)
+
+        # FastMCP は inspect.signature でツールの引数スキーマを作る。引数は
+        # 本体のものを見せ、戻り値だけ str に差し替える。
+        wrapper.__signature__ = inspect.signature(func).replace(
+            return_annotation=str
+        )
+        return wrapper
+
+    return decorator
+
+
+# instructions の定型部分。dedent は import 時に一度だけ行い、サーバー一覧は
+# build_server で差し込む。一覧を差し込んだ後に dedent すると、一覧の
+# 2 行目以降がインデント無しのため共通インデントが見つからず、定型部分の
+# インデントが残ってしまう。
+_INSTRUCTIONS_TEMPLATE = dedent(
+    """
+    MySQL と Postgres に接続する MCP サーバーです。
+    テーブルの読み取り権限のみ持ちます。Update, Insert はできません。
+    個人情報を含むテーブルや、秘密情報が含まれるテーブルは、
+    SELECT 権限を付与していないため内容を読み取ることはできませんが、
+    テーブルの構造を読むことはできます。
+
+    # SQL サーバー の名前 (server_name) と説明
+
+    下記はローカルキャッシュに基づく一覧です。最新の一覧は
+    list_sql_servers ツールで取得してください。
+
+    {sql_server_name_and_description}
+    """
+)
 
 
 def build_server() -> fastmcp.FastMCP:
@@ -32,19 +159,21 @@ def build_server() -> fastmcp.FastMCP:
     """
     cache = load_metadata_cache() or {}
     cached_servers = cache.get('sql_servers', [])
+    # server_name 一覧と instructions 用の説明文を 1 パスで組み立てる。
     # キャッシュが手動編集等で壊れて name 欠落があっても起動を止めない。
-    sql_server_names = [
-        server['name'] for server in cached_servers if server.get('name')
-    ]
-    if sql_server_names:
-        sql_server_name_and_description = '\n\n'.join(
-            [
-                f"## server_name: {server['name']}\n\n"
-                f"{server.get('description', '')}"
-                for server in cached_servers
-                if server.get('name')
-            ]
+    sql_server_names = []
+    server_descriptions = []
+    for server in cached_servers:
+        if not server.get('name'):
+            continue
+        sql_server_names.append(server['name'])
+        server_descriptions.append(
+            f"## server_name: {server['name']}\n\n"
+            f"{server.get('description', '')}"
         )
+    sql_server_names_csv = ', '.join(sql_server_names)
+    if sql_server_names:
+        sql_server_name_and_description = '\n\n'.join(server_descriptions)
     else:
         sql_server_name_and_description = (
             "(まだサーバー一覧をロードしていません。"
@@ -55,52 +184,65 @@ def build_server() -> fastmcp.FastMCP:
 
     server = fastmcp.FastMCP(
         name="sql-agent-mcp-server",
-        instructions=dedent(
-            f"""
-            MySQL と Postgres に接続する MCP サーバーです。
-            テーブルの読み取り権限のみ持ちます。Update, Insert はできません。
-            個人情報を含むテーブルや、秘密情報が含まれるテーブルは、
-            SELECT 権限を付与していないため内容を読み取ることはできませんが、
-            テーブルの構造を読むことはできます。
+        instructions=_INSTRUCTIONS_TEMPLATE.format(
+            sql_server_name_and_description=sql_server_name_and_description
+        ),
+    )
 
-            # SQL サーバー の名前 (server_name) と説明
+    # config はロード後に変わらないので、成功時のレスポンス JSON は初回に
+    # 一度だけ組み立てて使い回す。ロードに失敗した場合はキャッシュせず、
+    # 次回の呼び出しで再試行させる。
+    list_sql_servers_response: str | None = None
 
-            下記はローカルキャッシュに基づく一覧です。最新の一覧は
-            list_sql_servers ツールで取得してください。
+    def server_not_found(server_name: str) -> dict[str, Any]:
+        """存在しない server_name へのレスポンス
 
-            {sql_server_name_and_description}
-            """
-        ),
-    )
+        LLM の打ち間違い等は例外を経由せずに弾き、選べる名前を返して次の
+        呼び出しで訂正させる。
+        """
+        return {
+            'success': False,
+            'error': f'Server not found: {server_name}',
+            'server_name': server_name,
+            'available_server_names': manager.get_server_names(),
+        }
 
     @server.tool(
         name="list_sql_servers",
         description="""登録してある SQL サーバーの一覧を取得します。
 """,
     )
+    @_json_tool()
     async def list_sql_servers() -> str:
-        try:
-            servers = manager.get_server_list()
-            result = {
-                'success': True,
-                'servers': servers,
-                'count': len(servers),
-            }
-            logger.info(f"サーバー一覧を取得しました: {len(servers)} 個")
-            return json.dumps(result, ensure_ascii=False, indent=2)
-
-        except Exception as e:
-            logger.error(f"サーバー一覧取得エラー: {e}")
-            result = {'success': False, 'error': str(e)}
-            return json.dumps(result, ensure_ascii=False, indent=2)
+        nonlocal list_sql_servers_response
+        if list_sql_servers_response is not None:
+            return list_sql_servers_response
+
+        # 初回は config のロード (getter command の実行) を伴うので、
+        # イベントループを塞がないようワーカースレッドで実行する。
+        servers = await _run_blocking(
+            manager.get_server_list, executor=_CONFIG_EXECUTOR
+        )
+        result = {
+            'success': True,
+            'servers': servers,
+            'count': len(servers),
+        }
+        logger.info("サーバー一覧を取得しました: %d 個", len(servers))
+        list_sql_servers_response = _dumps(result)
+        return list_sql_servers_response
 
     @server.tool(
         name="execute_sql",
         description=f"""SQL クエリを実行し、結果を JSON で返します。
 
-利用可能な server_name: {', '.join(sql_server_names)}
+利用可能な server_name: {sql_server_names_csv}
 """,
     )
+    @_json_tool(
+        required={'server_name': _ERROR_NO_SERVER_NAME, 'sql': _ERROR_NO_SQL},
+        error_fields={'server_name': 'server_name', 'query': 'sql'},
+    )
     async def execute_sql(
         server_name: Annotated[
             str | None,
@@ -122,38 +264,96 @@ def build_server() -> fastmcp.FastMCP:
                 ],
             ),
         ] = None,
-    ) -> str:
-        if not server_name:
-            result = {
-                'success': False,
-                'error': 'server_name is not specified',
-            }
-            return json.dumps(result, ensure_ascii=False, indent=2)
-
-        if not sql:
-            result = {
-                'success': False,
-                'error': 'SQL query is not specified',
-            }
-            return json.dumps(result, ensure_ascii=False, indent=2)
-
-        try:
-            agent = manager.get_agent(server_name)
-
-            logger.info(f"SQL 実行開始 ({server_name})")
-            result = agent.execute_query(sql)
-
-            return json.dumps(result, ensure_ascii=False, indent=2)
-
-        except Exception as e:
-            logger.error(f"SQL 実行エラー ({server_name}): {e}")
-            result = {
-                'success': False,
-                'error': str(e),
-                'server_name': server_name,
-                'query': sql,
-            }
-            return json.dumps(result, ensure_ascii=False, indent=2)
+        params: Annotated[
+            list[Any] | dict[str, Any] | None,
+            Field(
+                description=(
+                    "SQL のプレースホルダに渡す値 (省略可)。"
+                    " 位置指定 (%s) ならリスト、名前指定 (%(name)s) なら"
+                    " オブジェクトで渡す。値はドライバがエスケープする。"
+                    " params を指定した場合、SQL 中のリテラルの % は %% と書く。"
+                ),
+                examples=[[1], {'user_id': 1}],
+            ),
+        ] = None,
+        result_format: Annotated[
+            ResultFormat,
+            Field(
+                description=(
+                    "結果行の形式。rows (既定) は行毎に列名をキーにした"
+                    " オブジェクト、columnar は columns と同じ順の値の配列。"
+                    " 行数や列数が多い場合は columnar の方が応答が小さい。"
+                ),
+            ),
+        ] = 'rows',
+    ) -> dict[str, Any]:
+        if not await _run_blocking(
+            manager.has_server, server_name, executor=_CONFIG_EXECUTOR
+        ):
+            return server_not_found(server_name)
+
+        agent = manager.get_agent(server_name)
+
+        logger.info("SQL 実行開始 (%s)", server_name)
+        # DB ドライバ (psycopg2 / pymysql) と SSH トンネルはブロッキング
+        # なので、ワーカースレッドで実行して他のツール呼び出しを待たせない。
+        # FastMCP は同期関数のツールもイベントループ上で直接呼ぶため、
+        # async def のまま _DB_EXECUTOR で逃がす。
+        return await _run_blocking(
+            agent.execute_query, sql, params, result_format
+        )
+
+    @server.tool(
+        name="execute_sql_batch",
+        description=f"""複数の SQL クエリを同じサーバーで順に実行し、文毎の結果を JSON で返します。
+
+接続の取得は 1 回で済むため、小さなクエリを続けて投げる場合は execute_sql を
+繰り返すより速くなります。各文はそれぞれ commit され、失敗した文があっても
+残りの文は実行されます。
+
+利用可能な server_name: {sql_server_names_csv}
+""",
+    )
+    @_json_tool(
+        required={
+            'server_name': _ERROR_NO_SERVER_NAME,
+            'sqls': _ERROR_NO_SQLS,
+        },
+        error_fields={'server_name': 'server_name', 'queries': 'sqls'},
+    )
+    async def execute_sql_batch(
+        server_name: Annotated[
+            str | None,
+            Field(
+                description=(
+                    "実行する SQL サーバーの名前。"
+                    " config.yaml の sql_servers の name"
+                ),
+                examples=sql_server_names,
+            ),
+        ] = None,
+        sqls: Annotated[
+            list[str] | None,
+            Field(
+                description="実行する SQL クエリのリスト。記述順に実行する",
+                examples=[
+                    [
+                        "SELECT COUNT(*) FROM users",
+                        "SELECT COUNT(*) FROM posts",
+                    ]
+                ],
+            ),
+        ] = None,
+    ) -> dict[str, Any]:
+        if not await _run_blocking(
+            manager.has_server, server_name, executor=_CONFIG_EXECUTOR
+        ):
+            return server_not_found(server_name)
+
+        agent = manager.get_agent(server_name)
+
+        logger.info("SQL バッチ実行開始 (%s): %d 件", server_name, len(sqls))
+        return await _run_blocking(agent.execute_batch, sqls)
 
     return server
 
@@ -183,9 +383,11 @@ def main() -> None:
         server = build_server()
         logger.info("SQL Agent Manager を初期化しました (config は遅延ロード)")
     except Exception as e:
-        error_msg = f"❌ エラー: MCP サーバーの構築に失敗しました: {e}"
-        logger.error(error_msg)
-        print(error_msg, file=sys.stderr)
+        logger.error("MCP サーバーの構築に失敗しました: %s", e)
+        print(
+            f"❌ エラー: MCP サーバーの構築に失敗しました: {e}",
+            file=sys.stderr,
+        )
         sys.exit(1)
 
     try:
@@ -194,7 +396,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("MCP サーバーを終了します (KeyboardInterrupt)")
     except Exception as e:
-        logger.error(f"MCP サーバーエラー: {e}", exc_info=True)
+        logger.error("MCP サーバーエラー: %s", e, exc_info=True)
         raise
 
 
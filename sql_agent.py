@@ -3,17 +3,23 @@
 SQL Agent - Core class for managing SQL connections and query execution
 """
 
-import decimal
+import atexit
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from datetime import date, datetime
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Literal, Mapping, Sequence
 
 import psycopg2
+import psycopg2.extensions
 import psycopg2.extras
 import pymysql
+import pymysql.converters
 import pymysql.cursors
+import pymysql.err
+from pymysql.constants import FIELD_TYPE
 from sshtunnel import SSHTunnelForwarder
 
 from config_loader import save_metadata_cache
@@ -41,6 +47,211 @@ def mask_sql_for_log(sql: str) -> str:
     return _SQL_STRING_LITERAL_RE.sub("'***'", masked)
 
 
+# execute_query の params。位置指定 (%s) はシーケンス、名前指定 (%(name)s) は
+# マッピングで渡す (psycopg2 / pymysql 共通)。
+QueryParams = Sequence[Any] | Mapping[str, Any]
+
+# 結果行の形式。'rows' は行毎の dict のリスト、'columnar' は値のリストの
+# リスト (列名は columns にだけ 1 回載るので、幅の広い結果で JSON が
+# 大幅に小さくなる)。
+ResultFormat = Literal['rows', 'columnar']
+RESULT_FORMATS = ('rows', 'columnar')
+
+# 1 サーバーあたりの接続数の既定の上限 (サーバー毎に pool_size で変更できる)。
+# 同時に開く接続はこの数までで、超えたクエリは接続が空くのを待つ。
+DEFAULT_POOL_SIZE = 4
+
+# 接続が空くのを待つ秒数の既定値 (サーバー毎に pool_timeout_seconds で変更
+# できる)。待っても空かなければそのクエリはエラーにする。
+DEFAULT_POOL_TIMEOUT_SECONDS = 30
+
+# SELECT で返す行数の既定の上限 (サーバー毎に max_rows で変更できる)。
+# 上限を超える分は読み捨て、レスポンスに truncated: true を付ける。
+DEFAULT_MAX_ROWS = 50000
+
+# fetchmany で一度に取り出す行数
+_FETCH_BATCH_SIZE = 5000
+
+# NUMERIC / DECIMAL 列は Decimal を経由せず float で受け取る。JSON にする時は
+# どのみち float にする (json_util) ので、セル毎に Decimal を作るのを省く。
+# 登録は接続毎に行い、同じプロセスで psycopg2 / pymysql を使う他のコードには
+# 影響させない。
+_PG_NUMERIC_AS_FLOAT = psycopg2.extensions.new_type(
+    psycopg2.extensions.DECIMAL.values,
+    'NUMERIC_AS_FLOAT',
+    lambda value, cursor: float(value) if value is not None else None,
+)
+# NUMERIC[] (OID 1231)
+_PG_NUMERIC_ARRAY_AS_FLOAT = psycopg2.extensions.new_array_type(
+    (1231,), 'NUMERIC_ARRAY_AS_FLOAT', _PG_NUMERIC_AS_FLOAT
+)
+_MYSQL_CONVERSIONS = {
+    **pymysql.converters.conversions,
+    FIELD_TYPE.DECIMAL: float,
+    FIELD_TYPE.NEWDECIMAL: float,
+}
+
+# クエリ結果キャッシュ (result_cache_ttl_seconds) の 1 サーバーあたりの上限件数
+_RESULT_CACHE_MAX_ENTRIES = 256
+
+# 結果をキャッシュしてよい読み取り専用のクエリ。先頭のキーワードで判定する。
+# EXPLAIN ANALYZE は文を実際に実行するので除く。
+_READ_ONLY_SQL_RE = re.compile(
+    r'\s*(?:SELECT|SHOW|DESC|DESCRIBE|EXPLAIN(?!\s+(?:ANALYZE|\()))\b',
+    re.IGNORECASE,
+)
+# 末尾以外に ; がある (複数の文を含む) SQL。先頭の文が読み取り専用でも後続の
+# 文が書き込みかもしれないので、キャッシュせず書き込みとして扱う。文字列
+# リテラルやコメント内の ; にも一致するが、キャッシュしないだけなので害は無い。
+_MULTI_STATEMENT_SQL_RE = re.compile(r';\s*\S')
+
+# MySQL でセッションに状態を残す文 (SET SESSION / ユーザー変数 / LOCK TABLES /
+# 一時テーブル / GET_LOCK / PREPARE 等)。MySQL には Postgres の DISCARD ALL に
+# 当たる文が無いので、これらを実行した接続はプールに戻さずに閉じる。
+# 文字列リテラル内に現れても一致するが、接続を開き直すだけなので害は無い。
+_MYSQL_SESSION_STATE_SQL_RE = re.compile(
+    r'^\s*(?:SET|LOCK|CREATE\s+TEMPORARY|PREPARE|HANDLER)\b'
+    r'|\bGET_LOCK\s*\(|@\w+\s*:=|\bINTO\s+@',
+    re.IGNORECASE,
+)
+# SELECT でも副作用を持ちうるもの (SELECT INTO, 行ロック, シーケンス操作)。
+# 文字列リテラル内に現れても一致するが、キャッシュしないだけなので害は無い。
+_SIDE_EFFECT_SQL_RE = re.compile(
+    r'\b(?:INTO|FOR\s+(?:UPDATE|SHARE)|NEXTVAL|SETVAL)\b',
+    re.IGNORECASE,
+)
+
+
+def _is_read_only_sql(sql: str) -> bool:
+    """SQL が副作用の無い読み取り専用の文か (キャッシュ・打ち切りの判定用)"""
+    return bool(
+        _READ_ONLY_SQL_RE.match(sql)
+        and not _SIDE_EFFECT_SQL_RE.search(sql)
+        and not _MULTI_STATEMENT_SQL_RE.search(sql)
+    )
+
+
+# 共有 SSH トンネルのキー: (SSH ホスト, SSH ポート, SSH ユーザー,
+# 転送先ホスト, 転送先ポート)
+SSHTunnelKey = tuple[str, int, str, str, int]
+
+
+def _stop_ssh_tunnel(
+    ssh_tunnel: SSHTunnelForwarder, key: SSHTunnelKey
+) -> None:
+    """SSH トンネルを閉じる (失敗してもログに残すだけ)"""
+    try:
+        ssh_tunnel.stop()
+    except Exception as e:
+        logger.warning("SSH トンネルのクローズに失敗 (%s:%s): %s", *key[:2], e)
+    logger.info("SSH トンネルを閉じました: %s:%s", key[0], key[1])
+
+
+class _SharedSSHTunnel:
+    """_SSHTunnelRegistry の 1 キー分 (トンネル・参照数・キー毎のロック)"""
+
+    def __init__(self) -> None:
+        # トンネルの確立・張り直しはこのロックの中で行う。SSH の
+        # ハンドシェイクは遅い (踏み台に繋がらなければタイムアウトまで
+        # 待つ) ので、他のキーのトンネルを待たせないようキー毎に分ける。
+        self.lock = threading.Lock()
+        self.tunnel: SSHTunnelForwarder | None = None
+        self.refs = 0
+
+
+class _SSHTunnelRegistry:
+    """
+    SSH トンネルを SQLAgent 間で共有するレジストリ (参照カウント付き)
+
+    テンプレートで同じ DB インスタンスの複数 schema を登録した場合など、
+    同じ踏み台から同じ転送先へ向かうサーバーが複数あっても、SSH の
+    ハンドシェイクとトンネルは 1 本で済ませる。最後の参照が release
+    されたらトンネルを閉じる。
+    """
+
+    def __init__(self) -> None:
+        # _tunnels の出し入れと参照数だけを守る (トンネルの確立中は持たない)
+        self._lock = threading.Lock()
+        self._tunnels: Dict[SSHTunnelKey, _SharedSSHTunnel] = {}
+
+    def get(
+        self,
+        key: SSHTunnelKey,
+        create: Callable[[], SSHTunnelForwarder],
+        acquire: bool,
+    ) -> SSHTunnelForwarder:
+        """
+        キーに対応する稼働中のトンネルを返す
+
+        Args:
+            key: トンネルのキー
+            create: トンネルが無い・切断されていた時に新しく張る関数
+            acquire: True なら参照数を 1 増やす (初回取得)。既に参照を
+                持っている呼び出し元が張り直しを求める時は False
+        """
+        with self._lock:
+            shared = self._tunnels.get(key)
+            if shared is None:
+                shared = self._tunnels[key] = _SharedSSHTunnel()
+            if acquire:
+                shared.refs += 1
+
+        try:
+            with shared.lock:
+                if shared.tunnel is None:
+                    shared.tunnel = create()
+                elif not shared.tunnel.is_active:
+                    logger.warning(
+                        "SSH トンネルが切断されていたため張り直します: %s:%s",
+                        key[0],
+                        key[1],
+                    )
+                    _stop_ssh_tunnel(shared.tunnel, key)
+                    shared.tunnel = None
+                    shared.tunnel = create()
+                return shared.tunnel
+        except BaseException:
+            # 確立に失敗したら、この呼び出しで増やした参照を戻す
+            if acquire:
+                self.release(key)
+            raise
+
+    def release(self, key: SSHTunnelKey) -> None:
+        """参照を 1 つ返す。参照が無くなったらトンネルを閉じる"""
+        with self._lock:
+            shared = self._tunnels.get(key)
+            if shared is None:
+                return
+            shared.refs -= 1
+            if shared.refs > 0:
+                return
+            del self._tunnels[key]
+        with shared.lock:
+            ssh_tunnel, shared.tunnel = shared.tunnel, None
+        if ssh_tunnel is not None:
+            _stop_ssh_tunnel(ssh_tunnel, key)
+
+
+_SSH_TUNNELS = _SSHTunnelRegistry()
+
+# 接続が切れた時にドライバが送出する例外
+_CONNECTION_ERRORS = (
+    psycopg2.OperationalError,
+    psycopg2.InterfaceError,
+    pymysql.err.OperationalError,
+    pymysql.err.InterfaceError,
+)
+
+
+class _StaleConnectionError(Exception):
+    """
+    借りた接続で最初の execute をした時点で、接続が既に切れていた
+
+    元の例外は __cause__ に入っている。プールから出した接続なら
+    新しい接続でやり直してよい (文はサーバーで確定していない)。
+    """
+
+
 class SQLAgent:
     """Class for managing SQL database connections and query execution"""
 
@@ -51,10 +262,42 @@ class SQLAgent:
         """
         self.config = config
         self.connection = None
-
-    def connect(self, ssh_tunnel: SSHTunnelForwarder = None) -> None:
+        self.max_rows: int = config.get('max_rows', DEFAULT_MAX_ROWS)
+        self.pool_size: int = config.get('pool_size', DEFAULT_POOL_SIZE)
+        self.pool_timeout: float = config.get(
+            'pool_timeout_seconds', DEFAULT_POOL_TIMEOUT_SECONDS
+        )
+        # 0 (既定) ならクエリ結果キャッシュは無効
+        self.result_cache_ttl: float = config.get(
+            'result_cache_ttl_seconds', 0
+        )
+        # (SQL, repr(params), result_format)
+        #   -> (有効期限 (time.monotonic), 結果)。LRU 順。
+        self._result_cache: OrderedDict[
+            tuple[str, str, str], tuple[float, Dict[str, Any]]
+        ] = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        # execute_query 用の接続プール (使い終わってアイドル状態の接続)。
+        # クエリ毎に TCP 接続 + 認証をやり直さないよう、使い終わった接続は
+        # 閉じずにここへ戻して次のクエリで再利用する。MCP ツールは
+        # ワーカースレッドから並行に呼ばれうるので _pool_lock で保護する。
+        self._idle_connections: List[Any] = []
+        self._pool_lock = threading.Lock()
+        # プールに戻さずに閉じる接続 (の id)。セッションに状態を残した接続や、
+        # 読み残した結果ごと閉じた接続
+        self._unpoolable_connections: set[int] = set()
+        # 同時に貸し出す接続数を pool_size までに抑え、並行なツール呼び出しが
+        # DB 側の接続数を食い潰さないようにする。
+        self._pool_slots = threading.BoundedSemaphore(self.pool_size)
+        # SSH トンネルは張ったままクエリ間で使い回す (SSH の鍵交換・認証は
+        # クエリ本体よりずっと重いため)。同じ踏み台・転送先のサーバー間では
+        # _SSH_TUNNELS で共有する。
+        self._ssh_tunnel: SSHTunnelForwarder | None = None
+        self._ssh_lock = threading.Lock()
+
+    def _open_connection(self, ssh_tunnel: SSHTunnelForwarder = None) -> Any:
         """
-        データベースに接続する
+        データベースへの新しい接続を開いて返す
 
         Args:
             ssh_tunnel: 使用する SSH トンネル (SSH トンネル経由の場合)
@@ -69,7 +312,7 @@ class SQLAgent:
                 db_port = self.config['port']
 
             if self.config['engine'] == 'postgres':
-                self.connection = psycopg2.connect(
+                connection = psycopg2.connect(
                     host=db_host,
                     port=db_port,
                     database=self.config['schema'],
@@ -77,8 +320,14 @@ class SQLAgent:
                     password=self.config['password'],
                     cursor_factory=psycopg2.extras.RealDictCursor,
                 )
+                psycopg2.extensions.register_type(
+                    _PG_NUMERIC_AS_FLOAT, connection
+                )
+                psycopg2.extensions.register_type(
+                    _PG_NUMERIC_ARRAY_AS_FLOAT, connection
+                )
             elif self.config['engine'] == 'mysql':
-                self.connection = pymysql.connect(
+                connection = pymysql.connect(
                     host=db_host,
                     port=db_port,
                     database=self.config['schema'],
@@ -86,179 +335,680 @@ class SQLAgent:
                     password=self.config['password'],
                     charset='utf8mb4',
                     cursorclass=pymysql.cursors.DictCursor,
+                    conv=_MYSQL_CONVERSIONS,
                 )
             else:
                 raise ValueError(
                     f"Unsupported engine: {self.config['engine']}"
                 )
 
-            logger.info(f"データベースに接続しました: {self.config['name']}")
+            logger.info("データベースに接続しました: %s", self.config['name'])
+            return connection
 
         except Exception as e:
             logger.error(
-                f"データベース接続エラー ({self.config['name']}): {e}"
+                "データベース接続エラー (%s): %s", self.config['name'], e
             )
             raise
 
+    def connect(self, ssh_tunnel: SSHTunnelForwarder = None) -> None:
+        """
+        データベースに接続する
+
+        Args:
+            ssh_tunnel: 使用する SSH トンネル (SSH トンネル経由の場合)
+        """
+        self.connection = self._open_connection(ssh_tunnel)
+
     def disconnect(self) -> None:
         """データベースから切断する"""
         if self.connection:
             self.connection.close()
             self.connection = None
-            logger.info(f"データベースから切断しました: {self.config['name']}")
+            logger.info(
+                "データベースから切断しました: %s", self.config['name']
+            )
 
-    def execute_query(self, sql: str) -> Dict[str, Any]:
+    def _is_connection_alive(self, connection: Any) -> bool:
         """
-        SQL クエリを実行する
-        SSH トンネルが設定されている場合は、クエリ実行毎にトンネルを作成・クローズする
+        プールから取り出したアイドル接続がまだ使えるかを確認する
 
-        Args:
-            sql: 実行する SQL クエリ
+        Postgres は往復の無い closed フラグを見るだけなので、アイドル中に
+        サーバー側で切られた接続 (DB の再起動・フェイルオーバー・
+        pg_terminate_backend・idle_session_timeout 等) はここでは検出
+        できない。その場合は最初の execute が失敗するので、呼び出し側で
+        新しい接続を開いてやり直す (_StaleConnectionError)。
+        """
+        try:
+            if self.config['engine'] == 'postgres':
+                return not connection.closed
+            else:
+                # wait_timeout 等でサーバーに切られていないかを確認する。
+                connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _is_connection_closed(self, connection: Any) -> bool:
+        """接続がドライバ上で切断済みになっているか"""
+        if self.config['engine'] == 'postgres':
+            return bool(connection.closed)
+        return not connection.open
+
+    def _close_connection(self, connection: Any) -> None:
+        """接続を閉じる (既に切れている場合の例外は無視する)"""
+        with self._pool_lock:
+            self._unpoolable_connections.discard(id(connection))
+        try:
+            connection.close()
+        except Exception:
+            pass
+        logger.info("データベースから切断しました: %s", self.config['name'])
+
+    def _take_idle_connection(self) -> Any:
+        """プールから使える接続を 1 つ取り出す。無ければ None"""
+        while True:
+            with self._pool_lock:
+                if not self._idle_connections:
+                    return None
+                connection = self._idle_connections.pop()
+            if self._is_connection_alive(connection):
+                return connection
+            self._close_connection(connection)
+
+    def _release_connection(self, connection: Any) -> None:
+        """
+        使い終わった接続をプールに戻す。上限を超える分は閉じる
 
-        Returns:
-            クエリ結果を含む辞書
+        前のクエリのセッション状態 (search_path / USE / SET SESSION /
+        一時テーブル / ロック等) を次のクエリに持ち越さないよう、戻す前に
+        セッションを接続直後の状態に戻す (_reset_session)。戻せない接続は
+        閉じる。
         """
-        ssh_tunnel = None
+        with self._pool_lock:
+            unpoolable = id(connection) in self._unpoolable_connections
+            self._unpoolable_connections.discard(id(connection))
+        if unpoolable:
+            self._close_connection(connection)
+            return
+        try:
+            self._reset_session(connection)
+        except Exception as e:
+            logger.warning(
+                "セッションのリセットに失敗したため接続を閉じます (%s): %s",
+                self.config['name'],
+                e,
+            )
+            self._close_connection(connection)
+            return
+        with self._pool_lock:
+            if len(self._idle_connections) < self.pool_size:
+                self._idle_connections.append(connection)
+                return
+        self._close_connection(connection)
+
+    def _reset_session(self, connection: Any) -> None:
+        """
+        commit 済みの接続のセッションを接続直後の状態に戻す
+
+        Postgres は DISCARD ALL で SET / search_path / 一時テーブル /
+        advisory lock / PREPARE 等をまとめて捨てる (トランザクション内では
+        実行できないので autocommit にして送る)。MySQL は USE で変わった
+        データベースを戻す。それ以外のセッション状態を残す文を実行した
+        MySQL の接続は、そもそもプールに戻さない
+        (_MYSQL_SESSION_STATE_SQL_RE)。
+        """
+        if self.config['engine'] == 'postgres':
+            connection.autocommit = True
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('DISCARD ALL')
+            finally:
+                connection.autocommit = False
+        else:
+            connection.select_db(self.config['schema'])
+
+    @contextmanager
+    def _acquire_connection(self, fresh: bool = False):
+        """
+        execute_query 用に接続を借りるコンテキストマネージャー
 
+        プールにアイドル接続があれば再利用し、無ければ新しく開く。正常終了時は
+        プールに戻し、例外時は接続の状態 (トランザクションの途中・切断済み等)
+        が分からないので戻さずに閉じる。貸し出し中の接続が pool_size 個ある
+        場合は、どれかが返却されるまで最大 pool_timeout 秒待ち、それでも
+        空かなければ TimeoutError を送出する (呼び出し側でエラー結果にする)。
+        遅いサーバーへの呼び出しが溜まって、MCP サーバーのワーカースレッドを
+        いつまでも塞がないようにするため。
+
+        プールから出した接続が切れていた (_StaleConnectionError) 場合は、
+        他のアイドル接続も同じ理由で切れている可能性が高いので一緒に捨て、
+        _StaleConnectionError を送出する。呼び出し側は fresh=True で
+        新しい接続を借りてやり直す。新しく開いた接続で起きた場合は元の
+        例外を送出する。
+
+        SSH トンネルが設定されている場合は、常駐させているトンネル経由で
+        接続する。
+
+        Args:
+            fresh: True ならプールを使わず新しい接続を開く
+        """
+        if not self._pool_slots.acquire(timeout=self.pool_timeout):
+            raise TimeoutError(
+                f"{self.pool_timeout} 秒待っても接続が空きませんでした"
+                f" (server_name={self.config['name']},"
+                f" pool_size={self.pool_size})"
+            )
         try:
-            # SSH トンネルが必要な場合は作成
+            ssh_tunnel = None
             if 'ssh_tunnel' in self.config:
-                ssh_tunnel = self._create_ssh_tunnel()
+                ssh_tunnel = self._ensure_ssh_tunnel()
 
-            # データベースに接続
-            self.connect(ssh_tunnel)
+            connection = None if fresh else self._take_idle_connection()
+            reused = connection is not None
+            if connection is None:
+                connection = self._open_connection(ssh_tunnel)
+            try:
+                yield connection
+            except _StaleConnectionError as e:
+                self._close_connection(connection)
+                if not reused:
+                    raise e.__cause__
+                logger.warning(
+                    "プールの接続が切れていたため新しい接続でやり直します"
+                    " (%s): %s",
+                    self.config['name'],
+                    e.__cause__,
+                )
+                self._discard_idle_connections()
+                raise
+            except BaseException:
+                self._close_connection(connection)
+                raise
+            self._release_connection(connection)
+        finally:
+            self._pool_slots.release()
 
-            sql_for_log = mask_sql_for_log(sql)
-            logger.info(
-                f"クエリ実行開始 ({self.config['name']}): {sql_for_log}"
+    def _discard_idle_connections(self) -> None:
+        """プールしているアイドル接続をすべて閉じる"""
+        with self._pool_lock:
+            connections, self._idle_connections = self._idle_connections, []
+        for connection in connections:
+            self._close_connection(connection)
+
+    def _ensure_ssh_tunnel(self) -> SSHTunnelForwarder:
+        """
+        常駐させている SSH トンネルを返す。未取得・切断済みなら取得し直す
+
+        トンネルは同じ踏み台・同じ接続先を使う SQLAgent 間で共有する
+        (_SSH_TUNNELS)。
+
+        Returns:
+            SSH トンネルインスタンス
+        """
+        with self._ssh_lock:
+            ssh_tunnel = self._ssh_tunnel
+            if ssh_tunnel is not None and ssh_tunnel.is_active:
+                return ssh_tunnel
+            # 未取得なら参照を 1 つ得る。取得済み (切断されていた) なら
+            # 参照数はそのままで、張り直されたトンネルを受け取る。
+            self._ssh_tunnel = _SSH_TUNNELS.get(
+                self._ssh_tunnel_key(),
+                self._create_ssh_tunnel,
+                acquire=ssh_tunnel is None,
             )
+            return self._ssh_tunnel
 
-            with self.connection.cursor() as cursor:
-                start_time = datetime.now()
-                cursor.execute(sql)
-
-                # 結果を取得できるクエリかどうかをチェック
-                try:
-                    rows = cursor.fetchall()
-                    # 結果を JSON シリアライズ可能な形式に変換
-                    serializable_rows = self._make_serializable(rows)
-
-                    # RETURNING を使う INSERT/UPDATE/DELETE は fetchall に成功し、
-                    # この分岐に入る。autocommit=False のため明示 commit しないと
-                    # disconnect 時にロールバックされて変更が消える。
-                    # SELECT に対しても commit() は安全 (進行中の暗黙トランザクションを
-                    # 終わらせるだけで、変更が無いので副作用は無い) なので無条件で呼ぶ。
-                    self.connection.commit()
-
-                    result = {
-                        'success': True,
-                        'query': sql,
-                        'rows': serializable_rows,
-                        'row_count': len(rows),
-                        'execution_time_ms': (
-                            datetime.now() - start_time
-                        ).total_seconds()
-                        * 1000,
-                        'server_name': self.config['name'],
-                    }
-                    logger.info(
-                        f"クエリ実行成功 ({self.config['name']}): {len(rows)} 行取得"
-                    )
-                except (
-                    psycopg2.ProgrammingError,
-                    pymysql.err.ProgrammingError,
-                ) as e:
-                    # 結果がないため fetchall が失敗する場合 (INSERT, UPDATE, DELETE など)
-                    logger.info(
-                        f"クエリ実行成功だが fetchall に失敗: {self.config['name']}, "
-                        f"{e.__class__.__name__}: {e}"
-                    )
-                    self.connection.commit()
-                    affected_rows = cursor.rowcount
-
-                    result = {
-                        'success': True,
-                        'query': sql,
-                        'affected_rows': affected_rows,
-                        'execution_time_ms': (
-                            datetime.now() - start_time
-                        ).total_seconds()
-                        * 1000,
-                        'server_name': self.config['name'],
-                    }
-
-                sql_log_tail = (
-                    sql_for_log[:100] + '...'
-                    if len(sql_for_log) > 100
-                    else sql_for_log
-                )
-                logger.info(
-                    f"クエリ実行完了 ({self.config['name']}): {sql_log_tail}"
-                )
-                return result
+    def _ssh_tunnel_key(self) -> SSHTunnelKey:
+        """共有トンネルのキー (踏み台と転送先が同じなら同じトンネルを使う)"""
+        ssh_config = self.config['ssh_tunnel']
+        return (
+            ssh_config['host'],
+            ssh_config.get('port', 22),
+            ssh_config['user'],
+            self.config['host'],
+            self.config['port'],
+        )
 
-        except Exception as e:
-            logger.error(
-                f"クエリ実行エラー ({self.config['name']}): {e.__class__.__name__}: {e}"
+    def _open_cursor(self, connection: Any, columnar: bool = False) -> Any:
+        """
+        execute_query 用のカーソルを開く
+
+        Postgres は接続の既定 (RealDictCursor) ではなくタプルを返すカーソルを
+        使い、行の dict 化は execute_query で列名を共有して行う。
+
+        MySQL は結果をクライアント側に溜め込まない SSDictCursor を使い、
+        fetchmany で読んだ分だけをメモリに載せる (max_rows で打ち切った
+        巨大な結果全体をバッファしない)。打ち切った読み取り専用の結果は
+        残りを読み捨てずに接続ごと閉じる (_discard_unread_result)。
+        dict の作り方 (重複列名の "テーブル名.列名" への付け替えを含む) は
+        DictCursor と同じ。
+
+        columnar の場合は MySQL もタプルを返す SSCursor を使い、行をそのまま
+        値のリストとして返す (dict を作らない)。
+        """
+        if self.config['engine'] == 'postgres':
+            return connection.cursor(cursor_factory=psycopg2.extensions.cursor)
+        if columnar:
+            return connection.cursor(pymysql.cursors.SSCursor)
+        return connection.cursor(pymysql.cursors.SSDictCursor)
+
+    def _fetch_rows(self, cursor: Any) -> tuple[List[Any], bool]:
+        """
+        結果行を fetchmany で少しずつ取り出す
+
+        max_rows 行まで取り出し、それを超える行があれば打ち切る。上限の判定の
+        ために最大で max_rows + 1 行だけ読む。
+
+        Returns:
+            (行のリスト, max_rows で打ち切ったか)
+        """
+        rows: List[Any] = []
+        limit = self.max_rows + 1
+        while len(rows) < limit:
+            batch_start_ns = time.perf_counter_ns()
+            batch = cursor.fetchmany(min(_FETCH_BATCH_SIZE, limit - len(rows)))
+            if not batch:
+                break
+            rows.extend(batch)
+            logger.debug(
+                "fetchmany (%s): %d 行 %.1f ms",
+                self.config['name'],
+                len(batch),
+                (time.perf_counter_ns() - batch_start_ns) / 1_000_000,
             )
-            result = {
-                'success': False,
-                'query': sql,
-                'error': f'{e.__class__.__name__}: {e}',
-                'server_name': self.config['name'],
-            }
+
+        truncated = len(rows) > self.max_rows
+        if truncated:
+            del rows[self.max_rows :]
+        return rows, truncated
+
+    def _discard_unread_result(self, connection: Any, cursor: Any) -> None:
+        """
+        MySQL の読み残した結果を読み捨てずに、接続ごと閉じる
+
+        カーソルを接続から切り離してから接続を閉じるので、カーソルの close
+        (with を抜けた時や GC 時) は残りの行を読もうとしない。閉じた接続は
+        _acquire_connection でプールに戻さずに捨てる。
+        """
+        with self._pool_lock:
+            self._unpoolable_connections.add(id(connection))
+        cursor.connection = None
+        try:
+            connection.close()
+        except Exception:
+            pass
+        logger.info(
+            "max_rows で打ち切った結果を読み捨てずに接続を閉じました: %s",
+            self.config['name'],
+        )
+
+    def close(self) -> None:
+        """プールしている接続と SSH トンネルをすべて閉じる"""
+        self.clear_cache()
+        self._discard_idle_connections()
+        with self._ssh_lock:
+            if self._ssh_tunnel is not None:
+                self._ssh_tunnel = None
+                _SSH_TUNNELS.release(self._ssh_tunnel_key())
+
+    def execute_query(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        result_format: ResultFormat = 'rows',
+    ) -> Dict[str, Any]:
+        """
+        SQL クエリを実行する
+        接続はプールから借りて実行後に返すので、同じサーバーへの 2 回目以降の
+        クエリは接続・認証を省ける。
+        SSH トンネルが設定されている場合は、常駐させているトンネルを経由する
+        result_cache_ttl_seconds が設定されている場合、読み取り専用のクエリの
+        結果はその秒数だけキャッシュし、同じ SQL にはキャッシュから返す。
+        キャッシュから返す結果は 'cached': True を持ち、execution_time_ms は
+        含まない。
+
+        Args:
+            sql: 実行する SQL クエリ
+            params: プレースホルダ (%s / %(name)s) に渡す値。指定した場合、
+                SQL 中のリテラルの % は %% と書く必要がある
+            result_format: 'rows' (既定) なら rows を列名をキーにした dict
+                のリストで、'columnar' なら columns と同じ順の値のリストの
+                リストで返す
+
+        Returns:
+            クエリ結果を含む辞書
+        """
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(
+                f"result_format は {', '.join(RESULT_FORMATS)} のいずれかを"
+                f"指定してください: {result_format!r}"
+            )
+
+        if self.result_cache_ttl <= 0:
+            return self._run_query(sql, params, result_format)
+
+        if not _is_read_only_sql(sql):
+            # 書き込みの可能性があるクエリの後は、キャッシュ済みの結果が
+            # 古くなっているかもしれないので全て捨てる。
+            self.clear_cache()
+            return self._run_query(sql, params, result_format)
+
+        cache_key = (sql.strip(), repr(params), result_format)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            logger.info("クエリ結果キャッシュを使用 (%s)", self.config['name'])
+            return {**cached, 'cached': True}
+
+        result = self._run_query(sql, params, result_format)
+        if result['success']:
+            # execution_time_ms は DB で実行した時の値なので、キャッシュから
+            # 返す (DB に問い合わせない) レスポンスには含めない。
+            self._put_cached_result(
+                cache_key,
+                {
+                    key: value
+                    for key, value in result.items()
+                    if key != 'execution_time_ms'
+                },
+            )
+        return result
+
+    def _get_cached_result(
+        self, cache_key: tuple[str, str, str]
+    ) -> Dict[str, Any] | None:
+        """有効期限内のキャッシュ済み結果を返す。無ければ None"""
+        with self._result_cache_lock:
+            entry = self._result_cache.get(cache_key)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._result_cache[cache_key]
+                return None
+            self._result_cache.move_to_end(cache_key)
             return result
 
-        finally:
-            # 接続を閉じる
-            self.disconnect()
+    def _put_cached_result(
+        self, cache_key: tuple[str, str, str], result: Dict[str, Any]
+    ) -> None:
+        """結果をキャッシュする。上限を超えたら最も古く使われたものを捨てる"""
+        expires_at = time.monotonic() + self.result_cache_ttl
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = (expires_at, result)
+            self._result_cache.move_to_end(cache_key)
+            while len(self._result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+                self._result_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """クエリ結果キャッシュを空にする"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+
+    def _run_query(
+        self,
+        sql: str,
+        params: QueryParams | None = None,
+        result_format: ResultFormat = 'rows',
+    ) -> Dict[str, Any]:
+        """
+        SQL クエリを DB で実行する (execute_query の本体。キャッシュを見ない)
 
-            # SSH トンネルを閉じる
-            if ssh_tunnel:
-                ssh_tunnel.stop()
-                logger.info(f"SSH トンネルを閉じました: {self.config['name']}")
+        Args:
+            sql: 実行する SQL クエリ
+            params: プレースホルダに渡す値
+            result_format: 結果行の形式 ('rows' / 'columnar')
 
-    def _make_serializable(self, data: Any) -> Any:
+        Returns:
+            クエリ結果を含む辞書
         """
-        データを JSON シリアライズ可能な形式に変換する
+        try:
+            try:
+                with self._acquire_connection() as connection:
+                    return self._execute_on_connection(
+                        connection, sql, params, result_format
+                    )
+            except _StaleConnectionError:
+                with self._acquire_connection(fresh=True) as connection:
+                    return self._execute_on_connection(
+                        connection, sql, params, result_format
+                    )
+        except Exception as e:
+            return self._error_result(sql, e)
+
+    def execute_batch(self, statements: List[str]) -> Dict[str, Any]:
+        """
+        複数の SQL を 1 つの接続で順に実行する
+
+        接続の取得 (プールからの貸し出し) は 1 回で済む。各文はそれぞれ
+        commit し、失敗した文は rollback して次の文に進む。複数文を
+        1 回の送信にまとめる (MULTI_STATEMENTS 等) ことはしない。
 
         Args:
-            data: 変換するデータ
+            statements: 実行する SQL クエリのリスト
 
         Returns:
-            シリアライズ可能なデータ
-        """
-        if isinstance(data, list):
-            return [self._make_serializable(item) for item in data]
-        elif isinstance(data, dict):
-            return {
-                key: self._make_serializable(value)
-                for key, value in data.items()
-            }
-        elif isinstance(data, (datetime, date)):
-            return data.isoformat()
-        elif isinstance(data, decimal.Decimal):
-            return float(data)
-        elif isinstance(data, bytes):
+            文毎の結果 (execute_query と同じ形式) を results に持つ辞書
+        """
+        if self.result_cache_ttl > 0:
+            # 書き込みを含みうるのでキャッシュは捨てる
+            self.clear_cache()
+
+        start_ns = time.perf_counter_ns()
+        results: List[Dict[str, Any]] = []
+        try:
+            try:
+                self._run_batch(statements, results)
+            except _StaleConnectionError:
+                # 借りた接続の最初の文の時点でプールの接続が切れていた。
+                # 続きの文から新しい接続でやり直す。
+                self._run_batch(statements, results, fresh=True)
+        except Exception as e:
+            for sql in statements[len(results) :]:
+                results.append(self._error_result(sql, e))
+
+        return {
+            'success': all(result['success'] for result in results),
+            'results': results,
+            'execution_time_ms': (time.perf_counter_ns() - start_ns)
+            / 1_000_000,
+            'server_name': self.config['name'],
+        }
+
+    def _run_batch(
+        self,
+        statements: List[str],
+        results: List[Dict[str, Any]],
+        fresh: bool = False,
+    ) -> None:
+        """
+        execute_batch の本体。文毎の結果を results に追加していく
+
+        results に既に結果がある文は飛ばし、続きの文から実行する。
+        """
+        while len(results) < len(statements):
+            with self._acquire_connection(fresh) as connection:
+                first = True
+                for sql in statements[len(results) :]:
+                    try:
+                        results.append(
+                            self._execute_on_connection(connection, sql)
+                        )
+                    except Exception as e:
+                        if isinstance(e, _StaleConnectionError):
+                            if first:
+                                # この接続で最初の文なら接続を借り直して
+                                # やり直す
+                                raise
+                            e = e.__cause__
+                        results.append(self._error_result(sql, e))
+                        # 失敗した文のトランザクションを終わらせ、次の文を
+                        # 実行できる状態に戻す。rollback 自体が失敗したら
+                        # (切断等) 接続ごと捨てて残りの文もエラーにする。
+                        connection.rollback()
+                    first = False
+                    if self._is_connection_closed(connection):
+                        # max_rows で打ち切った結果ごと接続を閉じた。
+                        # 残りの文は接続を借り直して実行する。
+                        break
+
+    def _execute_on_connection(
+        self,
+        connection: Any,
+        sql: str,
+        params: QueryParams | None = None,
+        result_format: ResultFormat = 'rows',
+    ) -> Dict[str, Any]:
+        """
+        借りている接続で SQL を 1 つ実行して commit し、結果の辞書を返す
+
+        失敗時は例外をそのまま送出する (呼び出し側でエラー結果にする)。
+        execute の時点で接続が切れていた場合は _StaleConnectionError を
+        送出する (commit まで進んだ文はやり直させない)。
+        """
+        sql_for_log = mask_sql_for_log(sql)
+        logger.info(
+            "クエリ実行開始 (%s): %s",
+            self.config['name'],
+            sql_for_log,
+        )
+
+        columnar = result_format == 'columnar'
+        discarded = False
+        with self._open_cursor(connection, columnar) as cursor:
+            start_ns = time.perf_counter_ns()
+            # params が無い時は引数自体を渡さない。渡すとドライバが
+            # SQL 中の % をプレースホルダとして解釈してしまう。
             try:
-                return data.decode('utf-8')
-            except UnicodeDecodeError:
-                return data.hex()
+                if params is None:
+                    cursor.execute(sql)
+                else:
+                    cursor.execute(sql, params)
+            except _CONNECTION_ERRORS as e:
+                if self._is_connection_closed(connection):
+                    raise _StaleConnectionError() from e
+                raise
+            # セッションに状態を残す MySQL の文なら、接続をプールに戻さない
+            is_mysql = self.config['engine'] == 'mysql'
+            if is_mysql and _MYSQL_SESSION_STATE_SQL_RE.search(sql):
+                with self._pool_lock:
+                    self._unpoolable_connections.add(id(connection))
+
+            # 結果セットを返さない文 (INSERT / UPDATE / DELETE / DDL
+            # など) は description が None になる。fetch を試して
+            # ProgrammingError で判定するより安く、確実。
+            returns_rows = cursor.description is not None
+            if returns_rows:
+                # datetime / Decimal / bytes 等の変換は JSON 化する時に
+                # json_util.dumps がまとめて行うので、ここでは行を
+                # そのまま返す (全セルを Python で舐め直さない)。
+                rows, truncated = self._fetch_rows(cursor)
+                if truncated and is_mysql and _is_read_only_sql(sql):
+                    # SSCursor は close で読み残した行を最後までネットワーク
+                    # から読み捨てる (その間プールの枠も塞いだまま)。
+                    # 読み取り専用の文なら commit する変更も無いので、
+                    # 読み捨てずに接続ごと閉じてプールに戻さない。
+                    self._discard_unread_result(connection, cursor)
+                    discarded = True
+                columns = [column[0] for column in cursor.description]
+                if self.config['engine'] == 'postgres' and not columnar:
+                    # タプルカーソルで取得し、列名のリストを全行で
+                    # 共有して dict にする (RealDictRow を 1 セルずつ
+                    # 組み立てるより速い)。
+                    rows = [dict(zip(columns, row)) for row in rows]
+                elif not columnar:
+                    # MySQL の DictCursor は重複した列名を "テーブル名.列名"
+                    # に付け替えて行のキーにする (SELECT a.id, b.id 等)。
+                    # columns も行のキーと同じ名前にする。description には
+                    # テーブル名が無いので、DictCursor が作ったキーの
+                    # リスト (_fields) を使う。
+                    columns = list(getattr(cursor, '_fields', columns))
+                # columnar ではタプルのまま返す (JSON では配列になる)。
+            else:
+                affected_rows = cursor.rowcount
+
+        # commit はカーソルを閉じてから行う (MySQL の SSDictCursor は
+        # close で読み残した行を読み捨てるまで次のコマンドを送れない)。
+        # RETURNING を使う INSERT/UPDATE/DELETE は行を返すが、
+        # autocommit=False のため明示 commit しないと変更が確定しない
+        # (プールに戻した接続のトランザクションに残ってしまう)。
+        # SELECT に対しても commit() は安全 (進行中の暗黙トランザクション
+        # を終わらせるだけで、変更が無いので副作用は無い) なので
+        # 文の種類によらず呼ぶ。読み残した結果ごと接続を閉じた
+        # (_discard_unread_result) 場合だけは commit できないので呼ばない
+        # (読み取り専用の文なので確定させる変更も無い)。
+        if not discarded:
+            connection.commit()
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        if returns_rows:
+            result = {
+                'success': True,
+                'query': sql,
+                'columns': columns,
+                'rows': rows,
+                'row_count': len(rows),
+                **({'truncated': True} if truncated else {}),
+                'execution_time_ms': execution_time_ms,
+                'server_name': self.config['name'],
+            }
+            logger.info(
+                "クエリ実行成功 (%s): %d 行取得%s",
+                self.config['name'],
+                len(rows),
+                ' (max_rows で打ち切り)' if truncated else '',
+            )
         else:
-            return data
+            result = {
+                'success': True,
+                'query': sql,
+                'affected_rows': affected_rows,
+                'execution_time_ms': execution_time_ms,
+                'server_name': self.config['name'],
+            }
+            logger.info(
+                "クエリ実行成功 (%s): %d 行に影響",
+                self.config['name'],
+                affected_rows,
+            )
+
+        # 切り詰めは %.100s に任せ、スライスの文字列を別途作らない。
+        logger.info(
+            "クエリ実行完了 (%s): %.100s%s",
+            self.config['name'],
+            sql_for_log,
+            '...' if len(sql_for_log) > 100 else '',
+        )
+        return result
+
+    def _error_result(self, sql: str, e: Exception) -> Dict[str, Any]:
+        """クエリの失敗をログに残し、エラー結果の辞書を返す"""
+        logger.error(
+            "クエリ実行エラー (%s): %s: %s",
+            self.config['name'],
+            e.__class__.__name__,
+            e,
+        )
+        return {
+            'success': False,
+            'query': sql,
+            'error': f'{e.__class__.__name__}: {e}',
+            'server_name': self.config['name'],
+        }
 
     @contextmanager
     def connection_context(self):
         """
         データベース接続のコンテキストマネージャー
-        SSH トンネルが設定されている場合は自動的に管理する
+        SSH トンネルが設定されている場合は常駐トンネルを使う
+        (トンネルは close() まで張ったままにする)
         """
         ssh_tunnel = None
 
         try:
-            # SSH トンネルが必要な場合は作成
+            # SSH トンネルが必要な場合は確立 (張り済みなら使い回す)
             if 'ssh_tunnel' in self.config:
-                ssh_tunnel = self._create_ssh_tunnel()
+                ssh_tunnel = self._ensure_ssh_tunnel()
 
             # データベースに接続
             self.connect(ssh_tunnel)
@@ -268,11 +1018,6 @@ class SQLAgent:
             # 接続を閉じる
             self.disconnect()
 
-            # SSH トンネルを閉じる
-            if ssh_tunnel:
-                ssh_tunnel.stop()
-                logger.info(f"SSH トンネルを閉じました: {self.config['name']}")
-
     def __enter__(self):
         """
         レガシー対応のコンテキストマネージャーの開始
@@ -280,7 +1025,9 @@ class SQLAgent:
         """
         if 'ssh_tunnel' in self.config:
             logger.warning(
-                f"SSH トンネルが設定されているため connection_context() の使用を推奨します: {self.config['name']}"
+                "SSH トンネルが設定されているため"
+                " connection_context() の使用を推奨します: %s",
+                self.config['name'],
             )
         self.connect()
         return self
@@ -302,6 +1049,9 @@ class SQLAgent:
             ),
             'ssh_username': ssh_config['user'],
             'remote_bind_address': (self.config['host'], self.config['port']),
+            # トンネルはクエリ間で張ったままにするので、アイドル中に
+            # NAT や sshd に切られないよう keepalive を送る。
+            'set_keepalive': 30.0,
         }
 
         # 認証方法の設定
@@ -326,8 +1076,11 @@ class SQLAgent:
         ssh_tunnel.start()
 
         logger.info(
-            f"SSH トンネルを確立しました: {ssh_config['host']}:{ssh_config.get('port', 22)} -> "
-            f"{self.config['host']}:{self.config['port']}"
+            "SSH トンネルを確立しました: %s:%s -> %s:%s",
+            ssh_config['host'],
+            ssh_config.get('port', 22),
+            self.config['host'],
+            self.config['port'],
         )
 
         return ssh_tunnel
@@ -349,20 +1102,51 @@ class SQLAgentManager:
         """
         self._config_loader = config_loader
         self._loaded = False
+        self._load_lock = threading.Lock()
         self.servers_config: List[Dict[str, Any]] = []
         self.server_configs: Dict[str, Dict[str, Any]] = {}
-        self.agents = {}
+        self.agents: Dict[str, SQLAgent] = {}
+        self._server_list: List[Dict[str, Any]] = []
+        # プールしている DB 接続・SSH トンネルはプロセス終了時にまとめて閉じる。
+        atexit.register(self.shutdown)
 
     def _ensure_loaded(self) -> None:
         """config を初回アクセス時に一度だけロードする (memoize)。"""
         if self._loaded:
             return
 
+        # ツールはワーカースレッドから並行に呼ばれうるので、初回ロードが
+        # 二重に走らない (= 認証プロンプトが二度出ない) よう直列化する。
+        with self._load_lock:
+            if not self._loaded:
+                self._load()
+
+    def _load(self) -> None:
+        """config をロードして各種属性を組み立てる。_load_lock 内で呼ぶ。"""
         config = self._config_loader()
         self.servers_config = config.get('sql_servers', [])
         self.server_configs = {
             server['name']: server for server in self.servers_config
         }
+        # SQLAgent の生成は接続を伴わず安価なので、ロード時に全サーバー分を
+        # 作っておく。get_agent はツール呼び出し毎に dict を 1 回引くだけになる。
+        self.agents = {
+            name: SQLAgent(server)
+            for name, server in self.server_configs.items()
+        }
+        # config はロード後に変わらないので、get_server_list の返す一覧も
+        # ここで一度だけ組み立てる。
+        self._server_list = [
+            {
+                'name': server['name'],
+                'description': server.get('description', ''),
+                'engine': server['engine'],
+                'host': server['host'],
+                'port': server['port'],
+                'schema': server['schema'],
+            }
+            for server in self.servers_config
+        ]
 
         # ロード成功時に、機密を除いたメタデータをキャッシュ更新する。
         # 次回起動時の instructions / ログパスに使われる (best-effort)。
@@ -379,15 +1163,20 @@ class SQLAgentManager:
                 setup_logger_for_mcp_server(config['log_file_path'])
             except Exception as e:
                 logger.warning(
-                    f"log_file_path への切り替えに失敗 (既存ロガーで続行): {e}"
+                    "log_file_path への切り替えに失敗 (既存ロガーで続行): %s",
+                    e,
                 )
 
         self._loaded = True
 
+    def shutdown(self) -> None:
+        """全 SQL Agent のプール済み接続と SSH トンネルを閉じる"""
+        for agent in self.agents.values():
+            agent.close()
+
     def get_agent(self, server_name: str) -> SQLAgent:
         """
         指定したサーバー名の SQL Agent を取得する
-        SQLAgent が存在しない場合は遅延生成する
 
         Args:
             server_name: サーバー名
@@ -396,37 +1185,28 @@ class SQLAgentManager:
             SQL Agent インスタンス
         """
         self._ensure_loaded()
-        if server_name not in self.server_configs:
+        agent = self.agents.get(server_name)
+        if agent is None:
             raise ValueError(f"Server not found: {server_name}")
+        return agent
 
-        # SQLAgent が未作成の場合は遅延生成
-        if server_name not in self.agents:
-            self.agents[server_name] = SQLAgent(
-                self.server_configs[server_name]
-            )
-            logger.info(f"SQLAgent を遅延生成しました: {server_name}")
+    def has_server(self, server_name: str) -> bool:
+        """指定したサーバー名が登録されているかを返す"""
+        self._ensure_loaded()
+        return server_name in self.agents
 
-        return self.agents[server_name]
+    def get_server_names(self) -> List[str]:
+        """登録されているサーバー名を config の記述順で返す"""
+        self._ensure_loaded()
+        return list(self.agents)
 
     def get_server_list(self) -> List[Dict[str, Any]]:
         """
         登録されているサーバーの一覧を取得する
 
         Returns:
-            サーバー情報のリスト
+            サーバー情報のリスト (ロード時に組み立てた共有のリスト。
+            変更しないこと)
         """
         self._ensure_loaded()
-        servers = []
-        for config in self.servers_config:
-            servers.append(
-                {
-                    'name': config['name'],
-                    'description': config.get('description', ''),
-                    'engine': config['engine'],
-                    'host': config['host'],
-                    'port': config['port'],
-                    'schema': config['schema'],
-                }
-            )
-
-        return servers
+        return self._server_list
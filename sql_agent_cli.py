@@ -10,12 +10,13 @@ import json
 import sys
 
 from config_loader import load_config
+from json_util import dumps
 from logging_config import setup_logger_for_mcp_server
-from sql_agent import SQLAgentManager
+from sql_agent import RESULT_FORMATS, SQLAgentManager
 
 
 def _print_json(data) -> None:
-    print(json.dumps(data, ensure_ascii=False, indent=2, default=str))
+    print(dumps(data, indent=True))
 
 
 def _read_sql_from_stdin_or_arg(sql_arg: str | None) -> str:
@@ -34,6 +35,19 @@ def _read_sql_from_stdin_or_arg(sql_arg: str | None) -> str:
     return sql
 
 
+def _parse_params(value: str) -> list | dict:
+    """--params の JSON を解釈する (配列かオブジェクトのみ受け付ける)"""
+    try:
+        params = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"JSON として解釈できません: {e}")
+    if not isinstance(params, (list, dict)):
+        raise argparse.ArgumentTypeError(
+            "JSON の配列かオブジェクトを指定してください"
+        )
+    return params
+
+
 def _build_manager() -> SQLAgentManager:
     # まずデフォルトパスでロガーを初期化 (load_config 失敗時にもログを残す)。
     # CLI は明示的に実行されるので、起動時に config をロードして認証が走っても
@@ -74,7 +88,28 @@ def cmd_execute_sql(args):
         )
         sys.exit(1)
 
-    result = agent.execute_query(sql)
+    result = agent.execute_query(sql, args.params, args.result_format)
+    _print_json(result)
+    if not result.get('success'):
+        sys.exit(1)
+
+
+def cmd_execute_sql_batch(args):
+    manager = _build_manager()
+
+    try:
+        agent = manager.get_agent(args.server)
+    except ValueError as e:
+        _print_json(
+            {
+                'success': False,
+                'error': str(e),
+                'server_name': args.server,
+            }
+        )
+        sys.exit(1)
+
+    result = agent.execute_batch(args.sql)
     _print_json(result)
     if not result.get('success'):
         sys.exit(1)
@@ -116,7 +151,7 @@ def build_parser() -> argparse.ArgumentParser:
         help='指定サーバーで SQL を実行し結果を JSON で出力',
         description=(
             '指定したサーバーで SQL クエリを実行し、結果を JSON で出力する。\n'
-            'SELECT は rows / row_count を、INSERT/UPDATE/DELETE は'
+            'SELECT は columns / rows / row_count を、INSERT/UPDATE/DELETE は'
             ' affected_rows を返す。\n'
             'SSH トンネルが必要なサーバーは自動的に確立・切断される。\n'
             '読み取り権限のみ付与されたサーバーでは UPDATE/INSERT は失敗する。'
@@ -127,6 +162,10 @@ def build_parser() -> argparse.ArgumentParser:
             '  sql-agent-cli execute-sql -s prod-db --sql "SHOW TABLES"\n'
             '  sql-agent-cli execute-sql -s prod-db --sql "SELECT * FROM users LIMIT 10"\n'
             '  cat query.sql | sql-agent-cli execute-sql -s prod-db\n'
+            '  sql-agent-cli execute-sql -s prod-db'
+            ' --sql "SELECT * FROM users WHERE id = %s" --params \'[1]\'\n'
+            '  sql-agent-cli execute-sql -s prod-db'
+            ' --sql "SELECT * FROM users" --result-format columnar\n'
         ),
     )
     p.add_argument(
@@ -140,8 +179,58 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help='実行する SQL クエリ。省略時は stdin から読み取る',
     )
+    p.add_argument(
+        '--params',
+        type=_parse_params,
+        default=None,
+        help=(
+            'SQL のプレースホルダ (%%s / %%(name)s) に渡す値を JSON で指定'
+            ' (例: \'[1, "a"]\' や \'{"id": 1}\')'
+        ),
+    )
+    p.add_argument(
+        '--result-format',
+        choices=RESULT_FORMATS,
+        default='rows',
+        help=(
+            '結果行の形式。rows は行毎の辞書、columnar は columns と同じ順の'
+            '値の配列 (既定: rows)'
+        ),
+    )
     p.set_defaults(func=cmd_execute_sql)
 
+    # execute-sql-batch
+    p = sub.add_parser(
+        'execute-sql-batch',
+        help='指定サーバーで複数の SQL を順に実行し文毎の結果を JSON で出力',
+        description=(
+            '指定したサーバーで複数の SQL を 1 つの接続で順に実行し、'
+            '文毎の結果を results に入れて JSON で出力する。\n'
+            '各文はそれぞれ commit され、失敗した文があっても残りの文は'
+            '実行される。'
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            '使用例:\n'
+            '  sql-agent-cli execute-sql-batch -s prod-db'
+            ' --sql "SELECT COUNT(*) FROM users"'
+            ' --sql "SELECT COUNT(*) FROM posts"\n'
+        ),
+    )
+    p.add_argument(
+        '-s',
+        '--server',
+        required=True,
+        help='接続先サーバー名 (config.yaml の sql_servers の name)',
+    )
+    p.add_argument(
+        '--sql',
+        action='append',
+        required=True,
+        help='実行する SQL クエリ。複数回指定でき、指定順に実行する',
+    )
+    p.set_defaults(func=cmd_execute_sql_batch)
+
     return parser
 
 
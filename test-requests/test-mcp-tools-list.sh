@@ -3,9 +3,18 @@
 
 cd $(dirname $0)/../
 
+# リクエストは間を空けずにまとめて送り (サーバーは届いた順に処理する)、
+# レスポンスが揃うまで stdin を閉じずに待つ (閉じるとサーバーは処理中の
+# リクエストを待たずに終了する)。
+responses=$(mktemp)
+trap 'rm -f $responses' EXIT
+
 {
     echo '{"jsonrpc": "2.0", "method": "notifications/initialized"}'
-    sleep 1
     echo '{"jsonrpc": "2.0", "id": 2, "method": "tools/list", "params": {}}'
-    sleep 1
-} | ./launch-mcp-server.sh | jq
+    # 受け取ったレスポンスの行数を見て抜ける (最大 10 秒)
+    for i in {1..200}; do
+        [ $(wc -l < $responses) -ge 1 ] && break
+        sleep 0.05
+    done
+} | ./launch-mcp-server.sh | tee $responses | jq
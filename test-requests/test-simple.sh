@@ -5,12 +5,20 @@
 
 cd $(dirname $0)/../
 
+# リクエストは間を空けずにまとめて送り (サーバーは届いた順に処理する)、
+# レスポンスが揃うまで stdin を閉じずに待つ (閉じるとサーバーは処理中の
+# リクエストを待たずに終了する)。
+responses=$(mktemp)
+trap 'rm -f $responses' EXIT
+
 # 一回だけテストしてレスポンスを確認
 {
     echo '{"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test-client", "version": "1.0.0"}}}'
-    sleep 0.5
     echo '{"jsonrpc": "2.0", "method": "notifications/initialized"}'
-    sleep 0.5
     echo '{"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "list_sql_servers", "arguments": {}}}'
-    sleep 1
-} | .venv/bin/python3 mcp_server.py
+    # 受け取ったレスポンスの行数を見て抜ける (最大 10 秒)
+    for i in {1..200}; do
+        [ $(wc -l < $responses) -ge 2 ] && break
+        sleep 0.05
+    done
+} | .venv/bin/python3 mcp_server.py | tee $responses
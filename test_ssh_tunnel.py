@@ -37,17 +37,23 @@ def test_ssh_tunnel():
     print(yaml.dump(test_config, allow_unicode=True, default_flow_style=False))
     
     # 実際に接続するには以下のコメントを外してください
+    # execute_query は SSH トンネルを張ったまま、接続もプールして使い回すので、
+    # 続けてクエリを投げてもトンネルの確立は最初の 1 回だけで済む。
     # agent = SQLAgent(test_config)
     # try:
-    #     agent.connect()
-    #     print("SSH トンネル経由でデータベースに接続しました！")
-    #     
     #     # テーブル一覧を取得
-    #     result = agent.get_table_list()
+    #     result = agent.execute_query(
+    #         "SELECT table_name FROM information_schema.tables"
+    #         " WHERE table_schema = 'public'"
+    #     )
     #     print(f"テーブル数: {result.get('row_count', 0)}")
-    #     
+    #
+    #     result = agent.execute_query("SELECT 1")
+    #     print(f"2 回目のクエリ: {result.get('execution_time_ms')} ms")
+    #
     # finally:
-    #     agent.disconnect()
+    #     # プールした接続と SSH トンネルを閉じる
+    #     agent.close()
     #     print("接続を閉じました")
 
 